@@ -8,10 +8,10 @@ import sqlite3
 import json
 import sys
 import os
+import queue
 from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import Optional, List
-import xml.etree.ElementTree as ET
+from typing import Iterator, Optional, List
+from xml.sax.saxutils import escape
 
 GREEN = '\033[0;32m'
 RED = '\033[0;31m'
@@ -21,8 +21,97 @@ NC = '\033[0m'
 
 DB_PATH = os.path.expanduser("~/.blackroad/podcast_host.db")
 
+# Timestamps are produced by SQLite as naive-UTC ISO 8601 strings with
+# millisecond precision (YYYY-MM-DDTHH:MM:SS.SSS). Older rows hold
+# datetime.isoformat() values (microseconds, or no fraction at all); both share
+# the same fixed-width prefix, so lexicographic order still sorts by time.
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+# SQL is kept in module-level constants so every call passes the exact same
+# string to sqlite3, which keys its prepared-statement cache on the SQL text.
+INSERT_PODCAST_SQL = (
+    "INSERT INTO podcasts (title, description, author, email, language, "
+    "category, website_url, image_url, explicit, created_at) "
+    f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, {SQL_NOW})"
+)
+INSERT_EPISODE_SQL = (
+    "INSERT INTO episodes (podcast_id, title, description, audio_file, "
+    "duration_s, published_at, season, episode_num, tags, created_at) "
+    f"VALUES (?, ?, ?, ?, ?, COALESCE(?, {SQL_NOW}), ?, ?, ?, {SQL_NOW})"
+)
+# INSERT ... RETURNING hands back generated columns without a second query.
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+INSERT_PODCAST_RETURNING_SQL = INSERT_PODCAST_SQL + " RETURNING id, created_at"
+INSERT_EPISODE_RETURNING_SQL = (
+    INSERT_EPISODE_SQL + " RETURNING id, created_at, published_at"
+)
+SELECT_PODCAST_BY_TITLE_SQL = "SELECT * FROM podcasts WHERE title = ?"
+SELECT_EPISODES_BY_PID_SQL = (
+    "SELECT * FROM episodes WHERE podcast_id = ? ORDER BY season, episode_num"
+)
+SELECT_EPISODES_BY_TITLE_SQL = (
+    "SELECT e.* FROM episodes e JOIN podcasts p ON e.podcast_id = p.id "
+    "WHERE p.title = ? ORDER BY e.season, e.episode_num"
+)
+SELECT_FEED_ITEMS_SQL = (
+    "SELECT title, description, published_at, duration_s, season, episode_num, "
+    "tags, audio_file FROM episodes WHERE podcast_id = ? "
+    "ORDER BY season, episode_num"
+)
+SELECT_NOW_SQL = f"SELECT {SQL_NOW}"
+SELECT_PODCAST_CREATED_AT_SQL = "SELECT created_at FROM podcasts WHERE id = ?"
+SELECT_EPISODE_TIMESTAMPS_SQL = (
+    "SELECT created_at, published_at FROM episodes "
+    "WHERE id BETWEEN ? AND ? ORDER BY id"
+)
+SELECT_ALL_EPISODES_SQL = (
+    "SELECT * FROM episodes ORDER BY podcast_id, season, episode_num"
+)
+PODCAST_STATS_SQL = (
+    "SELECT p.*, COUNT(e.id) AS episode_count, "
+    "COALESCE(SUM(e.duration_s), 0) AS total_duration_s, "
+    "MAX(e.published_at) AS latest_episode, "
+    "GROUP_CONCAT(DISTINCT e.season) AS seasons "
+    "FROM podcasts p LEFT JOIN episodes e ON e.podcast_id = p.id "
+    "GROUP BY p.id"
+)
+
+RSS_PROLOGUE_TEMPLATE = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd" '
+    'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>'
+    '<title>{title}</title><description>{description}</description>'
+    '<language>{language}</language><link>{link}</link>'
+    '<itunes:author>{author}</itunes:author><itunes:explicit>{explicit}</itunes:explicit>'
+    '<itunes:owner><itunes:name>{author}</itunes:name>'
+    '<itunes:email>{email}</itunes:email></itunes:owner>'
+    '<itunes:category text="{category}"/>{image}'
+)
+RSS_IMAGE_TEMPLATE = '<itunes:image href="{href}"/>'
+RSS_ITEM_TEMPLATE = (
+    '<item><title>{title}</title><description>{description}</description>'
+    '<pubDate>{pub}</pubDate><itunes:duration>{duration}</itunes:duration>'
+    '<itunes:season>{season}</itunes:season><itunes:episode>{episode}</itunes:episode>'
+    '{keywords}<enclosure url="{audio}" type="audio/mpeg" length="0"/>'
+    '<guid isPermaLink="false">{guid}</guid></item>'
+)
+RSS_KEYWORDS_TEMPLATE = '<itunes:keywords>{tags}</itunes:keywords>'
+RSS_EPILOGUE = '</channel></rss>'
+
+STATEMENT_CACHE_SIZE = 256
+
+# WAL turns each commit into a log append, and synchronous=NORMAL is safe
+# under WAL. Note WAL keeps -wal/-shm sidecar files next to DB_PATH.
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     title: str
     description: str
@@ -37,7 +126,7 @@ class Episode:
     created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Podcast:
     title: str
     description: str
@@ -56,7 +145,7 @@ def init_db():
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     c = conn.cursor()
-    c.execute("""
+    c.execute(f"""
         CREATE TABLE IF NOT EXISTS podcasts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT UNIQUE NOT NULL,
@@ -68,10 +157,10 @@ def init_db():
             website_url TEXT DEFAULT '',
             image_url TEXT DEFAULT '',
             explicit INTEGER DEFAULT 0,
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL DEFAULT ({SQL_NOW})
         )
     """)
-    c.execute("""
+    c.execute(f"""
         CREATE TABLE IF NOT EXISTS episodes (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             podcast_id INTEGER NOT NULL,
@@ -83,77 +172,172 @@ def init_db():
             season INTEGER DEFAULT 1,
             episode_num INTEGER DEFAULT 1,
             tags TEXT DEFAULT '',
-            created_at TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT ({SQL_NOW}),
             FOREIGN KEY (podcast_id) REFERENCES podcasts(id)
         )
     """)
+    # Serves WHERE podcast_id = ? ORDER BY season, episode_num without a sort.
+    # Title lookups already use the UNIQUE constraint's implicit index.
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_episodes_pid_season_ep
+        ON episodes(podcast_id, season, episode_num)
+    """)
     conn.commit()
     conn.close()
 
 
-class PodcastHost:
-    def __init__(self):
+def _open_connection(db_path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE,
+                           check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(CONNECTION_PRAGMAS)
+    return conn
+
+
+class PodcastHostPool:
+    """Bounded pool of pre-configured connections for long-lived library use.
+
+    The schema is initialised once here, so each PodcastHost built from the
+    pool skips init_db() and the connect/PRAGMA setup.
+    """
+
+    def __init__(self, size: int = 4):
         init_db()
-        self.conn = sqlite3.connect(DB_PATH)
-        self.conn.row_factory = sqlite3.Row
+        self.db_path = DB_PATH
+        self._conns = [_open_connection(self.db_path, check_same_thread=False)
+                       for _ in range(size)]
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        for conn in self._conns:
+            self._pool.put(conn)
+        self._closed = False
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("PodcastHostPool is closed")
+        return self._pool.get(timeout=timeout)
+
+    def release(self, conn: sqlite3.Connection):
+        # close() already shut every connection, including this one.
+        if self._closed:
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        self._pool.put(conn)
+
+    def close(self):
+        """Close every connection, including ones still checked out by hosts."""
+        self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait()
+            except queue.Empty:
+                break
+        for conn in self._conns:
+            conn.close()
+        self._conns = []
+
+
+class PodcastHost:
+    def __init__(self, pool: Optional[PodcastHostPool] = None):
+        self.pool = pool
+        if pool is not None:
+            self.conn = pool.acquire()
+        else:
+            init_db()
+            self.conn = _open_connection(DB_PATH)
 
     def close(self):
-        self.conn.close()
+        # Drop the handle after the first call so a second close() cannot hand
+        # the same connection back to the pool twice.
+        conn, self.conn = self.conn, None
+        if conn is None:
+            return
+        if self.pool is not None:
+            self.pool.release(conn)
+        else:
+            conn.close()
 
     def create_podcast(self, podcast: Podcast) -> Podcast:
-        podcast.created_at = datetime.utcnow().isoformat()
+        params = (podcast.title, podcast.description, podcast.author, podcast.email,
+                  podcast.language, podcast.category, podcast.website_url,
+                  podcast.image_url, int(podcast.explicit))
         c = self.conn.cursor()
         try:
-            c.execute("""
-                INSERT INTO podcasts (title, description, author, email, language,
-                    category, website_url, image_url, explicit, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (podcast.title, podcast.description, podcast.author, podcast.email,
-                  podcast.language, podcast.category, podcast.website_url,
-                  podcast.image_url, int(podcast.explicit), podcast.created_at))
-            self.conn.commit()
-            podcast.id = c.lastrowid
+            if HAS_RETURNING:
+                row = c.execute(INSERT_PODCAST_RETURNING_SQL, params).fetchone()
+                self.conn.commit()
+                podcast.id, podcast.created_at = row["id"], row["created_at"]
+            else:
+                c.execute(INSERT_PODCAST_SQL, params)
+                self.conn.commit()
+                podcast.id = c.lastrowid
+                c.execute(SELECT_PODCAST_CREATED_AT_SQL, (podcast.id,))
+                podcast.created_at = c.fetchone()["created_at"]
             print(f"{GREEN}✓ Created podcast: {podcast.title}{NC}")
         except sqlite3.IntegrityError:
             print(f"{YELLOW}⚠ Podcast '{podcast.title}' already exists{NC}")
         return podcast
 
     def add_episode(self, episode: Episode) -> Episode:
-        episode.created_at = datetime.utcnow().isoformat()
-        if not episode.published_at:
-            episode.published_at = episode.created_at
-        c = self.conn.cursor()
-        c.execute("""
-            INSERT INTO episodes (podcast_id, title, description, audio_file,
-                duration_s, published_at, season, episode_num, tags, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (episode.podcast_id, episode.title, episode.description, episode.audio_file,
-              episode.duration_s, episode.published_at, episode.season,
-              episode.episode_num, episode.tags, episode.created_at))
-        self.conn.commit()
-        episode.id = c.lastrowid
+        self._insert_episodes([episode])
         print(f"{GREEN}✓ Added episode S{episode.season:02d}E{episode.episode_num:02d}: "
               f"{episode.title}{NC}")
         return episode
 
+    def add_episodes(self, episodes: List[Episode]) -> List[Episode]:
+        """Insert many episodes with a single statement and a single commit."""
+        if not episodes:
+            return episodes
+        self._insert_episodes(episodes)
+        print(f"{GREEN}✓ Added {len(episodes)} episodes{NC}")
+        return episodes
+
+    def _insert_episodes(self, episodes: List[Episode]):
+        if not episodes:
+            return
+        params = ((ep.podcast_id, ep.title, ep.description, ep.audio_file,
+                   ep.duration_s, ep.published_at or None, ep.season,
+                   ep.episode_num, ep.tags) for ep in episodes)
+
+        if HAS_RETURNING and len(episodes) == 1:
+            ep = episodes[0]
+            with self.conn:
+                row = self.conn.execute(INSERT_EPISODE_RETURNING_SQL, next(params)).fetchone()
+            ep.id, ep.created_at, ep.published_at = row
+            return
+
+        # executemany cannot return rows, so a batch reads its generated
+        # timestamps back with one range query instead.
+        with self.conn:
+            c = self.conn.cursor()
+            c.executemany(INSERT_EPISODE_SQL, params)
+            # AUTOINCREMENT hands out consecutive rowids inside one write
+            # transaction, so the batch ends at last_insert_rowid().
+            last_id = c.execute("SELECT last_insert_rowid()").fetchone()[0]
+        first_id = last_id - len(episodes) + 1
+        c.execute(SELECT_EPISODE_TIMESTAMPS_SQL, (first_id, last_id))
+        for offset, (ep, r) in enumerate(zip(episodes, c)):
+            ep.id = first_id + offset
+            ep.created_at = r["created_at"]
+            ep.published_at = r["published_at"]
+
     def list_episodes(self, podcast_id: Optional[int] = None,
                       podcast_title: Optional[str] = None) -> List[Episode]:
+        return list(self.iter_episodes(podcast_id, podcast_title))
+
+    def iter_episodes(self, podcast_id: Optional[int] = None,
+                      podcast_title: Optional[str] = None) -> Iterator[Episode]:
+        """Yield episodes one row at a time straight off the cursor."""
         c = self.conn.cursor()
-        pid = podcast_id
-        if not pid and podcast_title:
-            c.execute("SELECT id FROM podcasts WHERE title = ?", (podcast_title,))
-            row = c.fetchone()
-            pid = row["id"] if row else None
-
-        if pid:
-            c.execute("""
-                SELECT * FROM episodes WHERE podcast_id = ?
-                ORDER BY season, episode_num
-            """, (pid,))
+        if podcast_id:
+            c.execute(SELECT_EPISODES_BY_PID_SQL, (podcast_id,))
+        elif podcast_title:
+            c.execute(SELECT_EPISODES_BY_TITLE_SQL, (podcast_title,))
         else:
-            c.execute("SELECT * FROM episodes ORDER BY podcast_id, season, episode_num")
+            c.execute(SELECT_ALL_EPISODES_SQL)
 
-        return [self._row_to_episode(r) for r in c.fetchall()]
+        for r in c:
+            yield self._row_to_episode(r)
 
     def _row_to_episode(self, r) -> Episode:
         return Episode(id=r["id"], podcast_id=r["podcast_id"], title=r["title"],
@@ -172,97 +356,90 @@ class PodcastHost:
     def generate_rss_feed(self, podcast_title: str,
                           output_path: Optional[str] = None) -> str:
         c = self.conn.cursor()
-        c.execute("SELECT * FROM podcasts WHERE title = ?", (podcast_title,))
+        c.execute(SELECT_PODCAST_BY_TITLE_SQL, (podcast_title,))
         prow = c.fetchone()
         if not prow:
             print(f"{RED}✗ Podcast not found: {podcast_title}{NC}")
             return ""
 
         podcast = self._row_to_podcast(prow)
-        episodes = self.list_episodes(podcast_id=podcast.id)
-
-        # Build RSS XML
-        rss = ET.Element("rss", version="2.0")
-        rss.set("xmlns:itunes", "http://www.itunes.com/dtds/podcast-1.0.dtd")
-        rss.set("xmlns:content", "http://purl.org/rss/1.0/modules/content/")
-
-        channel = ET.SubElement(rss, "channel")
-
-        ET.SubElement(channel, "title").text = podcast.title
-        ET.SubElement(channel, "description").text = podcast.description
-        ET.SubElement(channel, "language").text = podcast.language
-        ET.SubElement(channel, "link").text = podcast.website_url or "https://blackroad.io"
-        ET.SubElement(channel, "itunes:author").text = podcast.author
-        ET.SubElement(channel, "itunes:explicit").text = "yes" if podcast.explicit else "no"
-
-        owner = ET.SubElement(channel, "itunes:owner")
-        ET.SubElement(owner, "itunes:name").text = podcast.author
-        ET.SubElement(owner, "itunes:email").text = podcast.email
-
-        cat = ET.SubElement(channel, "itunes:category")
-        cat.set("text", podcast.category)
-
-        if podcast.image_url:
-            img = ET.SubElement(channel, "itunes:image")
-            img.set("href", podcast.image_url)
-
-        for ep in episodes:
-            item = ET.SubElement(channel, "item")
-            ET.SubElement(item, "title").text = ep.title
-            ET.SubElement(item, "description").text = ep.description or ""
-            ET.SubElement(item, "pubDate").text = ep.published_at or ""
-            ET.SubElement(item, "itunes:duration").text = str(ep.duration_s)
-            ET.SubElement(item, "itunes:season").text = str(ep.season)
-            ET.SubElement(item, "itunes:episode").text = str(ep.episode_num)
-            if ep.tags:
-                ET.SubElement(item, "itunes:keywords").text = ep.tags
-
-            enc = ET.SubElement(item, "enclosure")
-            enc.set("url", ep.audio_file)
-            enc.set("type", "audio/mpeg")
-            enc.set("length", "0")
-
-            guid = ET.SubElement(item, "guid")
-            guid.text = f"{podcast.website_url}/episodes/s{ep.season:02d}e{ep.episode_num:02d}"
-            guid.set("isPermaLink", "false")
-
-        tree = ET.ElementTree(rss)
         output_path = output_path or f"/tmp/{podcast_title.lower().replace(' ', '_')}_rss.xml"
-        ET.indent(tree, space="  ")
-        tree.write(output_path, encoding="unicode", xml_declaration=True)
+        # Plain tuples: each row is written once, so skip Row/Episode objects.
+        items = self.conn.cursor()
+        items.row_factory = None
+        items.execute(SELECT_FEED_ITEMS_SQL, (podcast.id,))
+
+        guid_prefix = escape(f"{podcast.website_url}/episodes/")
+        count = 0
+
+        def item_chunks():
+            nonlocal count
+            for title, desc, pub, dur, season, ep_num, tags, audio in items:
+                count += 1
+                yield RSS_ITEM_TEMPLATE.format(
+                    title=escape(title), description=escape(desc or ""),
+                    pub=escape(pub or ""), duration=dur, season=season,
+                    episode=ep_num,
+                    keywords=RSS_KEYWORDS_TEMPLATE.format(tags=escape(tags)) if tags else "",
+                    audio=_xml_attr(audio),
+                    guid=f"{guid_prefix}s{season:02d}e{ep_num:02d}",
+                )
+
+        image = (RSS_IMAGE_TEMPLATE.format(href=_xml_attr(podcast.image_url))
+                 if podcast.image_url else "")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(RSS_PROLOGUE_TEMPLATE.format(
+                title=escape(podcast.title),
+                description=escape(podcast.description or ""),
+                language=escape(podcast.language or ""),
+                link=escape(podcast.website_url or "https://blackroad.io"),
+                author=escape(podcast.author or ""),
+                explicit="yes" if podcast.explicit else "no",
+                email=escape(podcast.email or ""),
+                category=_xml_attr(podcast.category or ""),
+                image=image,
+            ))
+            f.writelines(item_chunks())
+            f.write(RSS_EPILOGUE)
+
         print(f"{GREEN}✓ RSS feed generated: {output_path} "
-              f"({len(episodes)} episodes){NC}")
+              f"({count} episodes){NC}")
         return output_path
 
     def export_stats(self, output_path: str = "/tmp/podcast_stats.json"):
         c = self.conn.cursor()
-        c.execute("SELECT * FROM podcasts")
-        podcasts = [self._row_to_podcast(r) for r in c.fetchall()]
-        stats = []
-        for p in podcasts:
-            episodes = self.list_episodes(podcast_id=p.id)
-            total_duration = sum(e.duration_s for e in episodes)
-            stats.append({
-                "podcast": asdict(p),
-                "episode_count": len(episodes),
-                "total_duration_s": total_duration,
-                "total_duration_hrs": round(total_duration / 3600, 2),
-                "seasons": list(set(e.season for e in episodes)),
-                "latest_episode": max(
-                    (e.published_at for e in episodes), default=None
-                )
-            })
-        data = {"podcasts": stats, "exported_at": datetime.utcnow().isoformat()}
+        exported_at = c.execute(SELECT_NOW_SQL).fetchone()[0]
+        c.execute(PODCAST_STATS_SQL)
+        dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+        # Emit one compact record per podcast so the export never holds the
+        # whole document in memory.
         with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write('{"podcasts":[')
+            for i, r in enumerate(c):
+                total_duration = r["total_duration_s"]
+                seasons = r["seasons"]
+                if i:
+                    f.write(",")
+                f.write(dumps({
+                    "podcast": asdict(self._row_to_podcast(r)),
+                    "episode_count": r["episode_count"],
+                    "total_duration_s": total_duration,
+                    "total_duration_hrs": round(total_duration / 3600, 2),
+                    "seasons": sorted(int(x) for x in seasons.split(",")) if seasons else [],
+                    "latest_episode": r["latest_episode"],
+                }))
+            f.write(f'],"exported_at":{dumps(exported_at)}}}')
         print(f"{GREEN}✓ Stats exported to {output_path}{NC}")
         return output_path
 
 
+def _xml_attr(value: str) -> str:
+    return escape(value, {'"': "&quot;"})
+
+
 def format_duration(seconds: int) -> str:
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
@@ -282,11 +459,14 @@ def main():
         if not episodes:
             print(f"{YELLOW}No episodes found.{NC}")
         else:
-            print(f"\n{CYAN}=== Episodes ({len(episodes)}) ==={NC}")
-            for e in episodes:
-                dur = format_duration(e.duration_s)
-                print(f"  S{e.season:02d}E{e.episode_num:02d} | "
-                      f"{CYAN}{e.title}{NC} | {dur} | {e.published_at[:10] if e.published_at else 'unpublished'}")
+            lines = [f"\n{CYAN}=== Episodes ({len(episodes)}) ==={NC}"]
+            lines.extend(
+                f"  S{e.season:02d}E{e.episode_num:02d} | {CYAN}{e.title}{NC} | "
+                f"{format_duration(e.duration_s)} | "
+                f"{e.published_at[:10] if e.published_at else 'unpublished'}"
+                for e in episodes
+            )
+            print("\n".join(lines))
     elif cmd == "add-podcast":
         if len(rest) < 3:
             print(f"{RED}Usage: add-podcast <title> <description> <author> [email]{NC}")
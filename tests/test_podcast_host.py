@@ -4,9 +4,11 @@
 import os
 import sys
 import json
+import queue
 import sqlite3
 import tempfile
 import unittest
+import unittest.mock
 import xml.etree.ElementTree as ET
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -37,6 +39,12 @@ class TestPodcastDataclass(unittest.TestCase):
         self.assertEqual(e.duration_s, 0)
         self.assertIsNone(e.id)
 
+    def test_dataclasses_use_slots(self):
+        e = ph.Episode(title="Ep 1", description="desc", audio_file="a.mp3")
+        p = ph.Podcast(title="My Show", description="A show", author="Alice")
+        self.assertFalse(hasattr(e, "__dict__"))
+        self.assertFalse(hasattr(p, "__dict__"))
+
 
 class TestInitDb(unittest.TestCase):
     def test_tables_created(self):
@@ -54,6 +62,20 @@ class TestInitDb(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_episode_index_created(self):
+        path = _make_tmp_db()
+        try:
+            ph.DB_PATH = path
+            ph.init_db()
+            conn = sqlite3.connect(path)
+            indexes = {r[0] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            ).fetchall()}
+            conn.close()
+            self.assertIn("idx_episodes_pid_season_ep", indexes)
+        finally:
+            os.unlink(path)
+
     def test_init_idempotent(self):
         path = _make_tmp_db()
         try:
@@ -87,6 +109,10 @@ class TestPodcastHost(unittest.TestCase):
             duration_s=3600, season=1, episode_num=num,
         )
 
+    def test_connection_uses_wal(self):
+        mode = self.host.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
     def test_create_podcast_assigns_id(self):
         p = self.host.create_podcast(self._podcast())
         self.assertIsNotNone(p.id)
@@ -110,6 +136,27 @@ class TestPodcastHost(unittest.TestCase):
         e = self.host.add_episode(self._episode(p.id))
         self.assertIsNotNone(e.published_at)
 
+    def test_add_episode_published_at_defaults_to_created_at(self):
+        p = self.host.create_podcast(self._podcast())
+        e = self.host.add_episode(self._episode(p.id))
+        self.assertEqual(e.published_at, e.created_at)
+        stored = self.host.list_episodes(podcast_id=p.id)[0]
+        self.assertEqual(stored.created_at, e.created_at)
+
+    def test_add_episodes_bulk_assigns_ids(self):
+        p = self.host.create_podcast(self._podcast("Bulk Show"))
+        episodes = self.host.add_episodes([self._episode(p.id, n) for n in range(1, 4)])
+        ids = [e.id for e in episodes]
+        self.assertEqual(len(set(ids)), 3)
+        stored = self.host.list_episodes(podcast_id=p.id)
+        self.assertEqual([e.id for e in stored], ids)
+        self.assertTrue(all(e.published_at for e in stored))
+
+    def test_add_episodes_empty_list(self):
+        with unittest.mock.patch("builtins.print") as mock_print:
+            self.assertEqual(self.host.add_episodes([]), [])
+        mock_print.assert_not_called()
+
     def test_list_episodes_empty(self):
         self.assertEqual(self.host.list_episodes(), [])
 
@@ -120,6 +167,18 @@ class TestPodcastHost(unittest.TestCase):
         episodes = self.host.list_episodes(podcast_title="Filtered Show")
         self.assertEqual(len(episodes), 2)
 
+    def test_list_episodes_unknown_title_is_empty(self):
+        p = self.host.create_podcast(self._podcast("Known Show"))
+        self.host.add_episode(self._episode(p.id))
+        self.assertEqual(self.host.list_episodes(podcast_title="Unknown Show"), [])
+
+    def test_iter_episodes_is_lazy(self):
+        p = self.host.create_podcast(self._podcast("Lazy Show"))
+        self.host.add_episodes([self._episode(p.id, n) for n in (1, 2)])
+        it = self.host.iter_episodes(podcast_id=p.id)
+        self.assertEqual(next(it).episode_num, 1)
+        self.assertEqual([e.episode_num for e in it], [2])
+
     def test_list_episodes_ordered_by_season_and_num(self):
         p = self.host.create_podcast(self._podcast("Ordered"))
         self.host.add_episode(ph.Episode(
@@ -173,6 +232,39 @@ class TestPodcastHost(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_rss_escapes_special_characters(self):
+        p = self.host.create_podcast(self._podcast("Q & A"))
+        self.host.add_episode(ph.Episode(
+            podcast_id=p.id, title="<Live> & Loud", description="d",
+            audio_file="https://cdn.io/ep.mp3?a=1&b=2",
+        ))
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            path = f.name
+        try:
+            self.host.generate_rss_feed("Q & A", path)
+            tree = ET.parse(path)
+            self.assertEqual(tree.findtext("./channel/title"), "Q & A")
+            self.assertEqual(tree.findtext(".//item/title"), "<Live> & Loud")
+            self.assertEqual(tree.find(".//item/enclosure").get("url"),
+                             "https://cdn.io/ep.mp3?a=1&b=2")
+        finally:
+            os.unlink(path)
+
+    def test_rss_handles_null_email(self):
+        p = self._podcast("No Email")
+        p.email = None
+        p = self.host.create_podcast(p)
+        self.host.add_episode(self._episode(p.id))
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            path = f.name
+        try:
+            self.host.generate_rss_feed("No Email", path)
+            tree = ET.parse(path)
+            self.assertEqual(tree.findtext(".//{*}email"), "")
+            self.assertEqual(len(tree.findall(".//item")), 1)
+        finally:
+            os.unlink(path)
+
     def test_rss_missing_podcast_returns_empty(self):
         result = self.host.generate_rss_feed("Nonexistent", "/tmp/nope.xml")
         self.assertEqual(result, "")
@@ -191,11 +283,85 @@ class TestPodcastHost(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_export_stats_aggregates(self):
+        p = self.host.create_podcast(self._podcast("Agg Show"))
+        self.host.create_podcast(self._podcast("Empty Show"))
+        self.host.add_episode(self._episode(p.id, 1))
+        self.host.add_episode(ph.Episode(
+            podcast_id=p.id, title="S2", description="d", audio_file="c.mp3",
+            duration_s=1800, season=2, episode_num=1,
+            published_at="2030-01-01T00:00:00",
+        ))
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            path = f.name
+        try:
+            self.host.export_stats(path)
+            with open(path) as f:
+                data = json.load(f)
+            by_title = {s["podcast"]["title"]: s for s in data["podcasts"]}
+            agg = by_title["Agg Show"]
+            self.assertEqual(agg["episode_count"], 2)
+            self.assertEqual(agg["total_duration_s"], 5400)
+            self.assertEqual(agg["seasons"], [1, 2])
+            self.assertEqual(agg["latest_episode"], "2030-01-01T00:00:00")
+            empty = by_title["Empty Show"]
+            self.assertEqual(empty["episode_count"], 0)
+            self.assertEqual(empty["seasons"], [])
+            self.assertIsNone(empty["latest_episode"])
+        finally:
+            os.unlink(path)
+
     def test_format_duration_helper(self):
         self.assertEqual(ph.format_duration(3661), "01:01:01")
         self.assertEqual(ph.format_duration(0), "00:00:00")
         self.assertEqual(ph.format_duration(7200), "02:00:00")
 
 
+class TestPodcastHostPool(unittest.TestCase):
+    def setUp(self):
+        self.path = _make_tmp_db()
+        ph.DB_PATH = self.path
+        self.pool = ph.PodcastHostPool(size=1)
+
+    def tearDown(self):
+        self.pool.close()
+        os.unlink(self.path)
+
+    def test_host_reuses_pooled_connection(self):
+        host = ph.PodcastHost(pool=self.pool)
+        conn = host.conn
+        host.create_podcast(ph.Podcast(title="Pooled", description="d", author="A"))
+        host.close()
+        host = ph.PodcastHost(pool=self.pool)
+        self.assertIs(host.conn, conn)
+        self.assertEqual(host.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        host.close()
+
+    def test_double_close_releases_once(self):
+        host = ph.PodcastHost(pool=self.pool)
+        host.close()
+        host.close()
+        self.assertIsNone(host.conn)
+        other = ph.PodcastHost(pool=self.pool)
+        self.assertRaises(queue.Empty, self.pool.acquire, timeout=0)
+        other.close()
+
+    def test_pool_close_closes_checked_out_connections(self):
+        host = ph.PodcastHost(pool=self.pool)
+        self.pool.close()
+        self.assertRaises(sqlite3.ProgrammingError, host.conn.execute, "SELECT 1")
+        host.close()
+        self.assertIsNone(host.conn)
+
+    def test_acquire_after_pool_close_raises(self):
+        self.pool.close()
+        self.assertRaises(RuntimeError, ph.PodcastHost, pool=self.pool)
+
+    def test_pool_tables_created(self):
+        host = ph.PodcastHost(pool=self.pool)
+        self.assertEqual(host.list_episodes(), [])
+        host.close()
+
+
 if __name__ == "__main__":
     unittest.main()